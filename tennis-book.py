@@ -3,16 +3,24 @@
 Tennis Book Application - Automated tennis court booking via PlayByPoint.
 """
 
+import asyncio
+import json
 import logging
+import logging.handlers
 import os
 import random
+import re
 import sys
 import time
 from datetime import date, timedelta
 from pathlib import Path
+from urllib.parse import urlparse
 
 import requests
-from playwright.sync_api import Playwright, sync_playwright
+from requests.adapters import HTTPAdapter
+from playwright.async_api import Browser, async_playwright
+from playwright.async_api import TimeoutError as PlaywrightTimeoutError
+from urllib3.util.retry import Retry
 
 # Credentials - use environment variables for security
 USER_NAME = os.getenv("PLAYBYPOINT_EMAIL", "")
@@ -21,29 +29,89 @@ BOOKED_DATE_FILE = os.getenv("BOOKED_DATE_FILE")
 BOOKING_SLOTS_ENV = os.getenv("BOOKING_SLOTS", "")
 PUSHOVER_USER_KEY = os.getenv("PUSHOVER_USER_KEY", "")
 PUSHOVER_API_TOKEN = os.getenv("PUSHOVER_API_TOKEN", "")
+STORAGE_STATE_FILE = os.getenv(
+    "STORAGE_STATE_FILE", str(Path("~/.cache/tennis-book/state.json").expanduser())
+)
+
+# Saved sessions older than this (seconds) are ignored and a fresh login is done
+STORAGE_STATE_MAX_AGE = 6 * 60 * 60
+
+BASE_URL = "https://app.playbypoint.com"
+SIGN_IN_URL = f"{BASE_URL}/users/sign_in"
+
+# Chromium flags pruning components the headless booking flow never uses
+CHROMIUM_ARGS = [
+    "--disable-dev-shm-usage",
+    "--disable-gpu",
+    "--disable-extensions",
+    "--disable-blink-features=AutomationControlled",
+]
+
+# Requests that never affect the booking flow and are aborted to speed up page loads.
+# Stylesheets are kept so element visibility/actionability checks stay reliable.
+BLOCKED_RESOURCE_TYPES = {"image", "font", "media"}
+BLOCKED_HOSTS_RE = re.compile(
+    r"google-analytics|googletagmanager|doubleclick|segment|hotjar|intercom|fullstory"
+)
 
 
 # Global wait constants: base wait (seconds) plus up-to `WAIT_JITTER` seconds random
 WAIT_BASE = 3.0
 WAIT_JITTER = 2.0
 
+# Maximum number of days booked at the same time, each in its own browser context
+MAX_CONCURRENT_BOOKINGS = 3
+
+# Maximum time (milliseconds) to wait for a page transition such as the login redirect
+NAVIGATION_TIMEOUT_MS = 15000
+# Maximum time (milliseconds) Playwright auto-waits for an element before acting on it
+ACTION_TIMEOUT_MS = 10000
+# Maximum time (milliseconds) to wait for an element whose absence is meaningful
+ELEMENT_TIMEOUT_MS = 5000
+
 
-def wait_random() -> None:
+async def wait_random() -> None:
     """Sleep for `WAIT_BASE` seconds plus up to `WAIT_JITTER` seconds random delay.
 
     Use global constants so timing is consistent and configurable from one place.
     """
-    time.sleep(WAIT_BASE + random.random() * WAIT_JITTER)  # nosec B311
+    await asyncio.sleep(WAIT_BASE + random.random() * WAIT_JITTER)  # nosec B311
 
 
-# Configure logging to stdout
+# Configure logging to stdout, buffered so records are written in batches.
+# Errors flush immediately; logging.shutdown() flushes the rest at exit.
+_log_stream = logging.StreamHandler(sys.stdout)
+_log_stream.setFormatter(logging.Formatter("%(asctime)s %(levelname)s: %(message)s"))
 logging.basicConfig(
     level=logging.INFO,
-    stream=sys.stdout,
-    format="%(asctime)s %(levelname)s: %(message)s",
+    handlers=[
+        logging.handlers.MemoryHandler(
+            capacity=64, flushLevel=logging.ERROR, target=_log_stream
+        )
+    ],
 )
 
 
+PUSHOVER_URL = "https://api.pushover.net/1/messages.json"
+
+
+def _make_pushover_session() -> requests.Session:
+    """Create a keep-alive session for Pushover with a small connect retry budget.
+
+    Only connection failures are retried so a message is never posted twice.
+    """
+    session = requests.Session()
+    retry = Retry(total=2, read=0, backoff_factor=0.5)
+    session.mount(
+        "https://", HTTPAdapter(pool_connections=1, pool_maxsize=2, max_retries=retry)
+    )
+    return session
+
+
+# Shared so repeated notifications reuse one TCP/TLS connection
+_PUSHOVER_SESSION = _make_pushover_session()
+
+
 def send_pushover_message(user_key, api_token, message, title=None):
     """Send a notification to Pushover. Prints errors but does not raise.
 
@@ -53,8 +121,6 @@ def send_pushover_message(user_key, api_token, message, title=None):
         logging.warning("Pushover credentials not set; skipping notification.")
         return
 
-    url = "https://api.pushover.net/1/messages.json"
-
     payload = {
         "token": api_token,
         "user": user_key,
@@ -65,56 +131,94 @@ def send_pushover_message(user_key, api_token, message, title=None):
         payload["title"] = title
 
     try:
-        response = requests.post(url, data=payload, timeout=10)
+        response = _PUSHOVER_SESSION.post(PUSHOVER_URL, data=payload, timeout=10)
         response.raise_for_status()
         logging.info("Pushover: message sent successfully")
     except requests.exceptions.RequestException as e:
         logging.exception(f"Pushover: failed to send message: {e}")
 
 
-def ensure_element(
-    locator, description: str, max_retries: int = 3, base_delay: float = 1.0
-):
-    """Verify the given Playwright locator matches at least one element.
+async def ensure_element(locator, description: str, timeout: int = ELEMENT_TIMEOUT_MS):
+    """Wait until the given Playwright locator matches a visible element.
 
-    Retries with exponential backoff if the element is not found.
-    Logs an error and raises RuntimeError if all retries fail.
+    Returns as soon as the element appears, in a single driver call.
+    Logs an error and raises RuntimeError if it doesn't appear within `timeout`.
     Returns the locator for convenience.
 
     Args:
         locator: Playwright locator object
         description: Human-readable description of the element
-        max_retries: Number of retries with exponential backoff (default: 3)
-        base_delay: Base delay in seconds for exponential backoff (default: 1.0)
+        timeout: Maximum wait in milliseconds (default: ELEMENT_TIMEOUT_MS)
     """
-    for attempt in range(max_retries):
-        try:
-            count = locator.count()
-            if count > 0:
-                return locator
-        except Exception:
-            if attempt == max_retries - 1:
-                logging.error(
-                    "Failed to query element after %d retries: %s",
-                    max_retries,
-                    description,
-                )
-                raise
-
-        # Calculate exponential backoff with jitter
-        if attempt < max_retries - 1:
-            delay = base_delay * (2**attempt) + random.random() * 0.1  # nosec B311
-            logging.debug(
-                "Element not found: %s, retrying in %.2fs (attempt %d/%d)",
-                description,
-                delay,
-                attempt + 1,
-                max_retries,
-            )
-            time.sleep(delay)
+    try:
+        await locator.first.wait_for(state="visible", timeout=timeout)
+    except PlaywrightTimeoutError:
+        logging.error("%s not found after %d ms.", description, timeout)
+        raise RuntimeError(f"{description} not found") from None
+    return locator
+
+
+# Time slot buttons that can be booked; unavailable ones have class "red"
+AVAILABLE_SLOT_SELECTOR = "button:not(.red)"
+
+# In-page sweep returning which wanted end times have an available slot button.
+# Matching mirrors Playwright's `has_text`: case-insensitive and
+# whitespace-normalized substring search.
+_AVAILABLE_SLOTS_JS = """([selector, wanted]) => {
+    const found = {};
+    for (const b of document.querySelectorAll(selector)) {
+        const text = b.textContent.replace(/\\s+/g, " ").toLowerCase();
+        for (const w of wanted) {
+            if (text.includes("-" + w.toLowerCase())) found[w] = true;
+        }
+    }
+    return Object.keys(found);
+}"""
+
+# Page predicate for wait_for_function: true once the sweep finds every wanted end time
+_ALL_SLOTS_AVAILABLE_JS = (
+    "(args) => (" + _AVAILABLE_SLOTS_JS + ")(args).length === new Set(args[1]).size"
+)
+
+# Calls click() on the first available slot button for each wanted end time, using
+# the same matching as _AVAILABLE_SLOTS_JS, and returns the end times it found a
+# button for. This does not confirm the site registered the selection.
+_CLICK_SLOTS_JS = """([selector, wanted]) => {
+    const clicked = [];
+    for (const w of wanted) {
+        const needle = "-" + w.toLowerCase();
+        for (const b of document.querySelectorAll(selector)) {
+            const text = b.textContent.replace(/\\s+/g, " ").toLowerCase();
+            if (text.includes(needle)) {
+                b.click();
+                clicked.push(w);
+                break;
+            }
+        }
+    }
+    return clicked;
+}"""
 
-    logging.error("%s not found after %d retries.", description, max_retries)
-    raise RuntimeError(f"{description} not found")
+
+async def find_available_slots(page, end_times: list[str]) -> set[str]:
+    """Return the subset of `end_times` that have an available slot button.
+
+    The list may still be rendering right after selecting a day, so this waits in
+    the page for every slot to show up, for at most ELEMENT_TIMEOUT_MS, then reads
+    which ones did in a single round-trip.
+
+    Args:
+        page: Playwright page object
+        end_times: End times of the wanted slots (e.g., ['8:30am', '9am'])
+    """
+    args = [AVAILABLE_SLOT_SELECTOR, end_times]
+    try:
+        await page.wait_for_function(
+            _ALL_SLOTS_AVAILABLE_JS, arg=args, timeout=ELEMENT_TIMEOUT_MS
+        )
+    except PlaywrightTimeoutError:
+        pass  # Some slots never showed up; report the ones that did
+    return set(await page.evaluate(_AVAILABLE_SLOTS_JS, args))
 
 
 def _parse_date_iso(s: str) -> date | None:
@@ -148,21 +252,26 @@ def parse_booking_slots(slots_str: str) -> list[tuple[str, list[str]]]:
         day_entry = day_entry.strip()
         if not day_entry:
             continue
-        parts = day_entry.split("_")
-        if len(parts) < 2:
+        day, *time_slots = (part.strip() for part in day_entry.split("_"))
+        if not time_slots:
             logging.warning(
                 "Invalid booking slot format '%s' (expected day_slot1_slot2_...)",
                 day_entry,
             )
             continue
-        day = parts[0].strip()
-        time_slots = [slot.strip() for slot in parts[1:]]
         bookings.append((day, time_slots))
     return bookings
 
 
-def load_booked_slots() -> set[tuple[str, str]]:
-    """Load booked slots from file pointed to by BOOKED_DATE_FILE env var.
+# Rewrite the booked-date file once appends make it this many times its compact size
+BOOKED_FILE_COMPACT_RATIO = 10
+
+# In-memory copy of the booked-date file, read once and kept in sync by saves
+_booked_cache: set[tuple[str, str]] | None = None
+
+
+def _read_booked_slots() -> set[tuple[str, str]]:
+    """Read booked slots from file pointed to by BOOKED_DATE_FILE env var.
 
     File format: one line per booked slot in format "day_time_slot"
     Example lines:
@@ -184,25 +293,36 @@ def load_booked_slots() -> set[tuple[str, str]]:
         logging.warning("Failed to read booked-date file: %s", path)
         return set()
 
-    booked = set()
-    for line in text.strip().split("\n"):
-        line = line.strip()
-        if not line:
-            continue
-        # Split from right to handle times like "5:30pm"
-        parts = line.rsplit("_", 1)
-        if len(parts) == 2:
-            day, time_slot = parts
-            booked.add((day.strip(), time_slot.strip()))
-    return booked
+    # Split from right to handle times like "5:30pm"; lines without "_" are skipped
+    return {
+        (day.strip(), time_slot.strip())
+        for day, sep, time_slot in (line.rpartition("_") for line in text.splitlines())
+        if sep
+    }
 
 
-def save_booked_slot(day: str, time_slot: str) -> None:
-    """Save a booked slot to the file.
+def load_booked_slots() -> set[tuple[str, str]]:
+    """Return booked slots, reading the booked-date file only on first use.
+
+    The returned set is shared and kept up to date by save_booked_slot().
+    """
+    global _booked_cache
+    if _booked_cache is None:
+        _booked_cache = _read_booked_slots()
+    return _booked_cache
+
+
+def compact_booked_slots(booked: set[tuple[str, str]]) -> None:
+    """Rewrite the booked-date file as sorted, de-duplicated lines when needed.
+
+    The file is only rewritten once it has grown past BOOKED_FILE_COMPACT_RATIO
+    times its de-duplicated size. A missing trailing newline, which would corrupt
+    the next append, is always added, even if no line could be parsed. Also
+    creates the file's parent directory so later appends can't fail on it. Meant
+    to run once per booking run; individual saves only append.
 
     Args:
-        day: Day of week (e.g., 'Sun', 'Tue')
-        time_slot: Time slot (e.g., '8am', '5:30pm')
+        booked: All booked (day, time_slot) tuples, as from load_booked_slots()
     """
     path = BOOKED_DATE_FILE
     if not path:
@@ -210,40 +330,147 @@ def save_booked_slot(day: str, time_slot: str) -> None:
     p = Path(path)
     try:
         p.parent.mkdir(parents=True, exist_ok=True)
-        # Load existing booked slots
+        if not p.exists():
+            return
+        with p.open("rb+") as f:
+            size = f.seek(0, os.SEEK_END)
+            if size:
+                f.seek(-1, os.SEEK_END)
+                if f.read(1) != b"\n":
+                    # Terminate the last line so the next append starts a new one
+                    f.write(b"\n")
+                    size += 1
+        compact_size = sum(len(f"{day}_{time_slot}\n") for day, time_slot in booked)
+        if not booked or size <= BOOKED_FILE_COMPACT_RATIO * compact_size:
+            return
+        # Write to a sibling temp file and swap it in so a crash can't truncate
+        tmp = p.with_name(p.name + ".tmp")
+        with tmp.open("w", encoding="utf-8") as f:
+            for day, time_slot in sorted(booked):
+                f.write(f"{day}_{time_slot}\n")
+        os.replace(tmp, p)
+    except Exception:
+        logging.exception("Failed to compact booked-date file: %s", path)
+
+
+def save_booked_slot(
+    day: str, time_slot: str, booked: set[tuple[str, str]] | None = None
+) -> None:
+    """Record a booked slot in memory and append it to the file.
+
+    Slots already recorded are not written again.
+
+    Args:
+        day: Day of week (e.g., 'Sun', 'Tue')
+        time_slot: Time slot (e.g., '8am', '5:30pm')
+        booked: Already-loaded booked slots to update (default: load_booked_slots())
+    """
+    if booked is None:
         booked = load_booked_slots()
-        # Add the new slot
-        booked.add((day, time_slot))
-        # Write all slots back
-        lines = [f"{day}_{time_slot}" for day, time_slot in sorted(booked)]
-        p.write_text("\n".join(lines), encoding="utf-8")
+    if (day, time_slot) in booked:
+        return
+    booked.add((day, time_slot))
+    path = BOOKED_DATE_FILE
+    if not path:
+        return
+    p = Path(path)
+    try:
+        with p.open("a", encoding="utf-8") as f:
+            f.write(f"{day}_{time_slot}\n")
         logging.info("Wrote booked slot %s_%s to %s", day, time_slot, path)
     except Exception:
         logging.exception("Failed to write booked-date file: %s", path)
 
 
+_ABB_TO_WDAY = {"Mon": 0, "Tue": 1, "Wed": 2, "Thu": 3, "Fri": 4, "Sat": 5, "Sun": 6}
+
+
 def next_date_for_day(day_str: str, reference: date | None = None) -> date:
     """Return the next date (including today) matching the weekday name/abbrev.
 
     day_str may be three-letter abbrev like 'Sat' or full name 'Saturday'.
-    Searches up to 6 days ahead.
+    Returns `reference` unchanged if the day name is not recognized.
     """
     if reference is None:
         reference = date.today()
-    name = day_str.strip()
-    key = name[:3].capitalize()
-    abb_to_wday = {"Mon": 0, "Tue": 1, "Wed": 2, "Thu": 3, "Fri": 4, "Sat": 5, "Sun": 6}
-    target = abb_to_wday.get(key)
+    target = _ABB_TO_WDAY.get(day_str.strip()[:3].capitalize())
     if target is None:
         return reference
-    for i in range(0, 7):
-        cand = reference + timedelta(days=i)
-        if cand.weekday() == target:
-            return cand
-    return reference
+    return reference + timedelta(days=(target - reference.weekday()) % 7)
+
 
+async def block_unneeded_requests(route) -> None:
+    """Playwright route handler aborting assets and trackers the flow doesn't need."""
+    request = route.request
+    host = urlparse(request.url).hostname or ""
+    if request.resource_type in BLOCKED_RESOURCE_TYPES or BLOCKED_HOSTS_RE.search(host):
+        await route.abort()
+    else:
+        await route.continue_()
 
-def login(page, username: str, password: str) -> None:
+
+def load_storage_state() -> str | None:
+    """Return the saved session file path if it exists and is recent enough.
+
+    Returns None when no usable session is available and a full login is needed.
+    """
+    if not STORAGE_STATE_FILE:
+        return None
+    p = Path(STORAGE_STATE_FILE)
+    try:
+        age = time.time() - p.stat().st_mtime
+    except OSError:
+        return None
+    if age > STORAGE_STATE_MAX_AGE:
+        logging.info("Saved session in %s is stale; logging in again", p)
+        return None
+    return str(p)
+
+
+def save_storage_state(state: dict) -> None:
+    """Persist a context's cookies/local storage so later runs can skip login.
+
+    Args:
+        state: Storage state as returned by BrowserContext.storage_state()
+    """
+    if not STORAGE_STATE_FILE:
+        return
+    p = Path(STORAGE_STATE_FILE)
+    try:
+        p.parent.mkdir(parents=True, exist_ok=True)
+        # Session cookies act as credentials: keep the file private to the user
+        p.touch(mode=0o600, exist_ok=True)
+        p.chmod(0o600)
+        p.write_text(json.dumps(state), encoding="utf-8")
+        logging.info("Saved session state to %s", p)
+    except Exception:
+        logging.exception("Failed to save session state: %s", p)
+
+
+def invalidate_storage_state() -> None:
+    """Remove the saved session file, e.g. after the server rejected it."""
+    if not STORAGE_STATE_FILE:
+        return
+    try:
+        Path(STORAGE_STATE_FILE).unlink(missing_ok=True)
+    except OSError:
+        logging.warning("Failed to remove session state: %s", STORAGE_STATE_FILE)
+
+
+async def resume_session(page) -> bool:
+    """Open PlayByPoint with a restored session.
+
+    Returns:
+        bool: True if still logged in, False if redirected to the sign-in page
+    """
+    await page.goto(BASE_URL, wait_until="domcontentloaded")
+    if page.url.split("?")[0].rstrip("/").endswith("/sign_in"):
+        logging.info("Session expired; logging in again")
+        return False
+    return True
+
+
+async def login(page, username: str, password: str) -> None:
     """Log in to PlayByPoint.
 
     Args:
@@ -251,29 +478,67 @@ def login(page, username: str, password: str) -> None:
         username: Email address for login
         password: Password for login
     """
-    page.goto("https://app.playbypoint.com/users/sign_in")
+    await page.goto(SIGN_IN_URL, wait_until="domcontentloaded")
     email = page.get_by_role("textbox", name="Email")
-    ensure_element(email, "Email textbox")
-    email.click()
-    email.fill(username)
-    email.press("Tab")
+    await email.click(timeout=ACTION_TIMEOUT_MS)
+    await email.fill(username)
+    await email.press("Tab")
     pwd = page.get_by_role("textbox", name="Password")
-    ensure_element(pwd, "Password textbox")
-    pwd.fill(password)
+    await pwd.fill(password, timeout=ACTION_TIMEOUT_MS)
     sign_btn = page.get_by_role("button", name="Sign in")
-    ensure_element(sign_btn, "Sign in button")
-    sign_btn.click()
+    await sign_btn.click(timeout=ACTION_TIMEOUT_MS)
 
 
-def navigate_to_booking(page) -> None:
-    """Navigate from login page to booking page."""
-    time.sleep(1)  # Wait for login to complete and redirect
+async def wait_for_booking_link(page):
+    """Wait for the logged-in landing page and return its Book Now link."""
+    # The link only shows up once login has completed and redirected
     link = page.get_by_role("link", name="Book Now")
-    ensure_element(link, "Book Now link")
-    link.click()
+    return await ensure_element(link, "Book Now link", timeout=NAVIGATION_TIMEOUT_MS)
+
+
+async def navigate_to_booking(page) -> None:
+    """Navigate from login page to booking page."""
+    link = await wait_for_booking_link(page)
+    await link.click()
+
 
+async def ensure_session(
+    browser: Browser, username: str, password: str
+) -> tuple[dict, bool]:
+    """Get a logged-in session once so concurrent day bookings can share it.
 
-def select_sport(page, sport: str) -> None:
+    Reuses the saved session file if it is recent and the server still accepts
+    it; otherwise removes the file and logs in. Nothing new is written to disk
+    here.
+
+    Returns:
+        tuple: (storage state dict for new contexts, True if a fresh login was done)
+    """
+    state_path = load_storage_state()
+    context = await browser.new_context(storage_state=state_path)
+    await context.route("**/*", block_unneeded_requests)
+    page = await context.new_page()
+    try:
+        logged_in = True
+        if state_path and await resume_session(page):
+            # Not every rejected session redirects to sign-in; missing Book Now
+            # after resuming means it wasn't accepted either
+            try:
+                await wait_for_booking_link(page)
+                logged_in = False
+            except RuntimeError:
+                logging.info("Saved session was not accepted; logging in again")
+        if logged_in:
+            if state_path:
+                invalidate_storage_state()
+            await login(page, username, password)
+            await wait_for_booking_link(page)
+        return await context.storage_state(), logged_in
+    finally:
+        await context.close()
+
+
+async def select_sport(page, sport: str) -> None:
     """Select a sport type (e.g., 'Tennis', 'Free Play').
 
     Args:
@@ -281,11 +546,12 @@ def select_sport(page, sport: str) -> None:
         sport: Name of the sport to select
     """
     sport_btn = page.get_by_role("button", name=sport, exact=True)
-    ensure_element(sport_btn, f"Sport button '{sport}'")
-    sport_btn.click()
+    await sport_btn.click(timeout=ACTION_TIMEOUT_MS)
 
 
-def explore_and_select_times(page, day: str, sport: str, end_times: list[str]) -> bool:
+async def explore_and_select_times(
+    page, day: str, sport: str, end_times: list[str]
+) -> bool:
     """Explore a sport tab and select available time slots for a given day.
 
     Searches for a specific day and time ranges, selecting all matching available slots.
@@ -301,45 +567,139 @@ def explore_and_select_times(page, day: str, sport: str, end_times: list[str]) -
         bool: True if time slots were found and selected, False otherwise
     """
     # Click the sport tab
-    select_sport(page, sport)
+    await select_sport(page, sport)
 
     # Click the day
     day_btn = page.get_by_role("button", name=day)
     try:
-        ensure_element(day_btn, f"Day button '{day}'")
+        await ensure_element(day_btn, f"Day button '{day}'")
     except RuntimeError:
         logging.warning("Day button for %s not found.", day)
         return False
-    day_btn.click()
+    await day_btn.click()
+
+    # Look up all requested time slots at once (e.g., "-8:30am" or "-9am").
+    # Unavailable buttons have class "red", so those are not counted.
+    available = await find_available_slots(page, end_times)
+    missing = [end_time for end_time in end_times if end_time not in available]
+    if missing:
+        for end_time in missing:
+            logging.warning("No available time slot ending at %s found.", end_time)
+        return False
 
-    # Find and click available time slots matching the ranges
-    buttons = []
+    # We have found all requested time slots, click them in a single round-trip
+    clicked = set(
+        await page.evaluate(_CLICK_SLOTS_JS, [AVAILABLE_SLOT_SELECTOR, end_times])
+    )
+    # Slots the batch click couldn't find get an auto-waiting Playwright click;
+    # one that turned unavailable in the meantime means the day can't be booked
+    slot_buttons = page.locator(AVAILABLE_SLOT_SELECTOR)
     for end_time in end_times:
-        # Look for buttons with time slot pattern (e.g., "-8:30am" or "-9am")
-        # Unavailable buttons have class "red", so we skip those.
-        end_button = page.locator(f'button:has-text("-{end_time}"):not(.red)')
+        if end_time in clicked:
+            continue
         try:
-            ensure_element(end_button, f"Time slot ending at {end_time}")
-        except RuntimeError:
-            logging.warning("No available time slot ending at %s found.", end_time)
+            await slot_buttons.filter(has_text=f"-{end_time}").first.click(
+                timeout=ELEMENT_TIMEOUT_MS
+            )
+        except PlaywrightTimeoutError:
+            logging.warning("Time slot ending at %s is no longer available.", end_time)
             return False
+    return True
 
-        buttons.append(end_button)
 
-    # We have found all requested time slots, click them
-    for end_button in buttons:
-        end_button.first.click()
-    return True
+async def open_booking_page(page) -> None:
+    """Open the booking page in an extra tab of an already logged-in context."""
+    await page.goto(BASE_URL, wait_until="domcontentloaded")
+    await navigate_to_booking(page)
+
+
+async def select_times_for_any_sport(
+    context, page, day: str, sports: list[str], end_times: list[str]
+):
+    """Explore all sports in parallel, one tab each, and keep the preferred one.
+
+    The first sport uses `page`, which must already be on the booking page; the
+    others get new tabs in `context`. The earliest sport in `sports` that has all
+    requested slots wins: a later sport succeeding first is only picked once all
+    earlier ones have come up empty. A sport whose exploration raises is logged
+    and treated as having no slots. Remaining explorations are then cancelled and
+    their tabs closed.
 
+    Args:
+        context: Logged-in Playwright browser context
+        page: Playwright page already on the booking page
+        day: Day of week to search for (e.g., 'Sat', 'Mon')
+        sports: Sport types to try (e.g., ['Tennis', 'Free Play'])
+        end_times: End times of the wanted slots (e.g., ['8:30am', '9am'])
+
+    Returns:
+        The page where the time slots were selected, or None if no sport had them
+
+    Raises:
+        Exception: The first sport's error, if exploring every sport raised
+    """
+
+    async def explore_in_new_tab(tab, sport: str) -> bool:
+        await open_booking_page(tab)
+        return await explore_and_select_times(tab, day, sport, end_times)
+
+    pages = [page] + [await context.new_page() for _ in sports[1:]]
+    tasks = [
+        asyncio.create_task(
+            explore_and_select_times(tab, day, sport, end_times)
+            if tab is page
+            else explore_in_new_tab(tab, sport)
+        )
+        for tab, sport in zip(pages, sports)
+    ]
 
-def proceed_to_next(page) -> None:
+    winner = None
+    errors = []
+    pending = set(tasks)
+    try:
+        while pending and winner is None:
+            _, pending = await asyncio.wait(
+                pending, return_when=asyncio.FIRST_COMPLETED
+            )
+            # Walk sports in preference order, stopping at the first still running
+            errors = []
+            for tab, sport, task in zip(pages, sports, tasks):
+                if not task.done():
+                    break
+                error = task.exception()
+                if error is not None:
+                    errors.append(error)
+                elif task.result():
+                    winner = tab
+                    break
+        if winner is None and errors and len(errors) == len(tasks):
+            raise errors[0]
+    finally:
+        for task in pending:
+            task.cancel()
+        await asyncio.gather(*pending, return_exceptions=True)
+        for tab in pages[1:]:
+            if tab is not winner:
+                await tab.close()
+        # Log every failed sport, including when all of them failed and we raise
+        for sport, task in zip(sports, tasks):
+            if task.done() and not task.cancelled() and task.exception() is not None:
+                logging.warning(
+                    "Exploring %s for %s failed; treating it as unavailable",
+                    sport,
+                    day,
+                    exc_info=task.exception(),
+                )
+    return winner
+
+
+async def proceed_to_next(page) -> None:
     """Click the Next button to proceed."""
     btn = page.get_by_role("button", name="Next")
-    ensure_element(btn, "Next button")
-    btn.click()
+    await btn.click(timeout=ACTION_TIMEOUT_MS)
 
 
-def add_players(page, count: int = 1) -> None:
+async def add_players(page, count: int = 1) -> None:
     """Add players to the booking.
 
     Args:
@@ -347,46 +707,52 @@ def add_players(page, count: int = 1) -> None:
         count: Number of additional players to add
     """
     add_players_btn = page.get_by_role("button", name="Add Players")
-    ensure_element(add_players_btn, "Add Players button")
-    add_players_btn.click()
-    for i in range(1, count + 1):
-        add_btn = page.get_by_role("button", name="Add").nth(i)
-        ensure_element(add_btn, f"Add button #{i}")
-        add_btn.click()
+    await add_players_btn.click(timeout=ACTION_TIMEOUT_MS)
+    if count < 1:
+        return
+    # Player "Add" buttons start at index 1 (the first match is "Add Players").
+    # Wait until the last wanted one exists, then click them all in one round-trip.
+    add_btns = page.get_by_role("button", name="Add")
+    await add_btns.nth(count).wait_for(timeout=ACTION_TIMEOUT_MS)
+    await add_btns.evaluate_all(
+        "(els, n) => { for (let i = 1; i <= n && i < els.length; i++) els[i].click(); }",
+        count,
+    )
 
 
-def confirm_booking(page) -> None:
+async def confirm_booking(page) -> None:
     """Confirm the booking."""
     book_btn = page.get_by_role("button", name="Book")
-    ensure_element(book_btn, "Book button")
-    book_btn.click()
+    await book_btn.click(timeout=ACTION_TIMEOUT_MS)
 
 
-def select_num_players(page, count: int) -> None:
+async def select_num_players(page, count: int) -> None:
     num_btn = page.get_by_role("button", name=str(count))
-    ensure_element(num_btn, f"Number of players button {count}")
-    num_btn.click()
+    await num_btn.click(timeout=ACTION_TIMEOUT_MS)
 
 
-def book_court(
-    playwright: Playwright,
+async def book_court(
+    browser: Browser,
     username: str,
     password: str,
     day: str,
     time_slots: list[str],
     sports: list[str] | None = None,
     extra_player_count: int = 0,
+    storage_state: dict | None = None,
 ) -> bool:
     """Complete flow: login, select sport/days, select times, and book.
 
     Args:
-        playwright: Playwright instance
+        browser: Shared Browser instance; each booking gets its own context
         username: Email for login
         password: Password for login
         day: Day to book (e.g., 'Sat')
         time_slots: End of time slots to book (e.g., ['8:30am', '9am'])
         sports: Sport types to try (default: ['Tennis', 'Free Play'])
         extra_player_count: Number of additional players to add (default: 0)
+        storage_state: Logged-in session to start from, as from ensure_session();
+            falls back to a full login if missing or rejected
 
     Returns:
         bool: True if booking was successful, False if no slots available
@@ -396,41 +762,47 @@ def book_court(
     """
     if sports is None:
         sports = ["Tennis", "Free Play"]
-    browser = playwright.chromium.launch(headless=True)
-    context = browser.new_context()
-    page = context.new_page()
+    context = await browser.new_context(storage_state=storage_state)
+    await context.route("**/*", block_unneeded_requests)
+    page = await context.new_page()
 
     try:
-        # Login flow
-        login(page, username, password)
-        navigate_to_booking(page)
-
-        # Selection flow
-        for sport in sports:
-            if not explore_and_select_times(page, day, sport, time_slots):
-                continue
-            proceed_to_next(page)
+        # Login flow, skipped when the shared session is still valid
+        link = None
+        if storage_state and await resume_session(page):
+            try:
+                link = await wait_for_booking_link(page)
+            except RuntimeError:
+                logging.info("Shared session was not accepted; logging in again")
+        if link is None:
+            await login(page, username, password)
+            link = await wait_for_booking_link(page)
+        await link.click()
+
+        # Selection flow, all sports explored in parallel tabs
+        page = await select_times_for_any_sport(context, page, day, sports, time_slots)
+        if page is None:
+            # No sports had available slots
+            return False
 
-            select_num_players(page, 1 + extra_player_count)
+        await proceed_to_next(page)
 
-            # Player and confirmation flow
-            if extra_player_count > 0:
-                add_players(page, extra_player_count)
-            proceed_to_next(page)
-            confirm_booking(page)
+        await select_num_players(page, 1 + extra_player_count)
 
-            logging.info("Successfully booked court for %s at %s", day, time_slots)
-            return True  # Exit after successful booking
+        # Player and confirmation flow
+        if extra_player_count > 0:
+            await add_players(page, extra_player_count)
+        await proceed_to_next(page)
+        await confirm_booking(page)
 
-        # No sports had available slots
-        return False
+        logging.info("Successfully booked court for %s at %s", day, time_slots)
+        return True
 
     finally:
-        context.close()
-        browser.close()
+        await context.close()
 
 
-def run_bookings() -> dict:
+async def run_bookings() -> dict:
     """Run the booking process and return results.
 
     Raises:
@@ -441,6 +813,8 @@ def run_bookings() -> dict:
         dict: Booking results with keys:
             - successful: list of (day, time_slots) tuples that were booked
             - unavailable: list of (day, time_slots) tuples with no available slots
+            - failed: list of (day, time_slots, error_message) tuples whose booking
+              raised an error
             - skipped: list of (day, time_slots) tuples that were already booked
     """
     if not USER_NAME or not USER_PWD:
@@ -460,44 +834,126 @@ def run_bookings() -> dict:
     booked_slots = load_booked_slots()
 
     # Categorize bookings
-    results = {"successful": [], "unavailable": [], "skipped": []}
-
+    results = {"successful": [], "unavailable": [], "failed": [], "skipped": []}
+
+    # Drop exact duplicate entries so the same booking isn't attempted twice.
+    # Different slot lists for one day stay separate bookings.
+    bookings = [
+        (day, list(time_slots))
+        for day, time_slots in dict.fromkeys(
+            (day, tuple(time_slots)) for day, time_slots in bookings
+        )
+    ]
+
+    # Short-circuit before any browser work when every wanted slot is booked
+    all_wanted = {(day, slot) for day, slots in bookings for slot in slots}
+    if all_wanted <= booked_slots:
+        logging.info("All requested slots are already booked")
+        results["skipped"] = bookings
+        return results
+
+    # Entries for the same day are booked one after another by a single task so
+    # they can't race for a shared slot; different days run concurrently
+    pending_by_day: dict[str, list[list[str]]] = {}
     for day, time_slots in bookings:
-        # Keep only time slots that haven't been booked yet
-        pending_slots = [slot for slot in time_slots if (day, slot) not in booked_slots]
-        if not pending_slots:
+        if all((day, slot) in booked_slots for slot in time_slots):
             results["skipped"].append((day, time_slots))
             logging.info("All slots for %s are already booked", day)
             continue
+        pending_by_day.setdefault(day, []).append(time_slots)
 
-        # Try to book pending slots
-        with sync_playwright() as playwright:
-            success = book_court(
-                playwright,
-                username=USER_NAME,
-                password=USER_PWD,
-                day=day,
-                time_slots=pending_slots,
-                sports=["Tennis", "Free Play"],
-                extra_player_count=1,
-            )
+    # Try to book pending slots, one concurrent task per day sharing one browser
+    async with async_playwright() as playwright:
+        # Boot Chromium while the booked-date file is tidied for appends
+        browser_task = asyncio.create_task(
+            playwright.chromium.launch(headless=True, args=CHROMIUM_ARGS)
+        )
+        await asyncio.to_thread(compact_booked_slots, booked_slots)
+        browser = await browser_task
 
-            if success:
-                # Save booked slots
-                for time_slot in pending_slots:
-                    save_booked_slot(day, time_slot)
-                results["successful"].append((day, pending_slots))
-            else:
-                results["unavailable"].append((day, pending_slots))
+        try:
+            # Log in a single time up front instead of once per concurrent day
+            storage_state, logged_in = await ensure_session(
+                browser, USER_NAME, USER_PWD
+            )
+            if logged_in:
+                save_storage_state(storage_state)
+
+            # Cap concurrent sessions to bound memory and load on the booking site
+            semaphore = asyncio.Semaphore(MAX_CONCURRENT_BOOKINGS)
+
+            async def book_day(day: str, entries: list[list[str]]) -> list[tuple]:
+                """Book a day's entries in turn; returns (category, result) pairs."""
+                day_results = []
+                async with semaphore:
+                    for time_slots in entries:
+                        # Keep only time slots that haven't been booked yet,
+                        # including by an earlier entry for this day
+                        pending_slots = [
+                            slot
+                            for slot in time_slots
+                            if (day, slot) not in booked_slots
+                        ]
+                        if not pending_slots:
+                            logging.info("All slots for %s are already booked", day)
+                            day_results.append(("skipped", (day, time_slots)))
+                            continue
+                        try:
+                            success = await book_court(
+                                browser,
+                                username=USER_NAME,
+                                password=USER_PWD,
+                                day=day,
+                                time_slots=pending_slots,
+                                sports=["Tennis", "Free Play"],
+                                extra_player_count=1,
+                                storage_state=storage_state,
+                            )
+                        except Exception as e:
+                            logging.error(
+                                "Booking failed for %s at %s",
+                                day,
+                                pending_slots,
+                                exc_info=e,
+                            )
+                            error = str(e) or type(e).__name__
+                            day_results.append(("failed", (day, pending_slots, error)))
+                            continue
+                        if success:
+                            # Save booked slots before the day's next entry runs
+                            for time_slot in pending_slots:
+                                save_booked_slot(day, time_slot, booked_slots)
+                            day_results.append(("successful", (day, pending_slots)))
+                        else:
+                            day_results.append(("unavailable", (day, pending_slots)))
+                return day_results
+
+            # One day failing must not lose the outcome of the others
+            outcomes = await asyncio.gather(
+                *[book_day(day, entries) for day, entries in pending_by_day.items()],
+                return_exceptions=True,
+            )
+        finally:
+            await browser.close()
+
+    for (day, entries), outcome in zip(pending_by_day.items(), outcomes):
+        if isinstance(outcome, BaseException):
+            logging.error("Booking failed for %s", day, exc_info=outcome)
+            error = str(outcome) or type(outcome).__name__
+            results["failed"].extend((day, slots, error) for slots in entries)
+            continue
+        for category, entry in outcome:
+            results[category].append(entry)
 
     return results
 
 
 def format_booking_results(results: dict) -> str:
-    """Format booking results for notification.
+    """Format booking results for the single end-of-run notification.
 
     Args:
-        results: Dictionary from run_bookings() with successful/unavailable/skipped
+        results: Dictionary from run_bookings() with successful/unavailable/
+            failed/skipped
 
     Returns:
         Formatted string describing the booking results
@@ -514,6 +970,11 @@ def format_booking_results(results: dict) -> str:
         for day, slots in results["unavailable"]:
             lines.append(f"  - {day}: {', '.join(slots)}")
 
+    if results["failed"]:
+        lines.append(f"⚠ Failed with an error for {len(results['failed'])} day(s):")
+        for day, slots, error in results["failed"]:
+            lines.append(f"  - {day}: {', '.join(slots)} ({error})")
+
     if results["skipped"]:
         lines.append(f"⊘ Skipped {len(results['skipped'])} day(s) (already booked):")
         for day, slots in results["skipped"]:
@@ -523,34 +984,32 @@ def format_booking_results(results: dict) -> str:
 
 
 def main():
-    """Main entry point for the application."""
+    """Main entry point for the application.
+
+    Exactly one Pushover message is sent per run, built by
+    format_booking_results(); add per-day details there rather than sending
+    extra notifications. Exits with an error if any day's booking raised.
+    """
     try:
-        results = run_bookings()
+        results = asyncio.run(run_bookings())
         message = format_booking_results(results)
         logging.info("Booking results:\n%s", message)
 
         # Notify with results
-        if results["successful"]:
-            send_pushover_message(
-                PUSHOVER_USER_KEY,
-                PUSHOVER_API_TOKEN,
-                message,
-                title="Tennis Court Bookings - Success!",
-            )
+        if results["failed"]:
+            title = "Tennis Court Bookings - Error"
+        elif results["successful"]:
+            title = "Tennis Court Bookings - Success!"
         elif results["unavailable"]:
-            send_pushover_message(
-                PUSHOVER_USER_KEY,
-                PUSHOVER_API_TOKEN,
-                message,
-                title="Tennis Court Bookings - No Availability",
-            )
+            title = "Tennis Court Bookings - No Availability"
         else:
-            send_pushover_message(
-                PUSHOVER_USER_KEY,
-                PUSHOVER_API_TOKEN,
-                message,
-                title="Tennis Court Bookings - All Already Booked",
-            )
+            title = "Tennis Court Bookings - All Already Booked"
+        send_pushover_message(
+            PUSHOVER_USER_KEY,
+            PUSHOVER_API_TOKEN,
+            message,
+            title=title,
+        )
     except Exception as e:
         logging.exception("Booking process failed")
         send_pushover_message(
@@ -561,6 +1020,10 @@ def main():
         )
         raise
 
+    # Already notified above; still exit non-zero so cron/CI sees the failure
+    if results["failed"]:
+        raise RuntimeError(f"Booking failed for {len(results['failed'])} day(s)")
+
 
 if __name__ == "__main__":
     main()